@@ -4,13 +4,14 @@
 # ==============================================================
 
 from __future__ import annotations
-import json, math, os, random
+import math, os, random
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional, Tuple
 
-from fastapi import FastAPI, Request
+import msgspec
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
 
 # ==============================================================
 # 🔧 FastAPI Setup
@@ -27,12 +28,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# GZip לתשובות JSON גדולות (חוסך בייטים ברשתות סלולר)
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
 # ==============================================================
 # 🩺 Health Check Endpoint
 # ==============================================================
 
 @app.get("/health")
-def health():
+async def health() -> Dict[str, Any]:
     return {
         "status": "ok",
         "version": "v11.3",
@@ -40,11 +44,36 @@ def health():
         "timestamp": datetime.utcnow().isoformat() + "Z"
     }
 
+# ==============================================================
+# 📄 Request Schema
+# ==============================================================
+
+class StockRequest(msgspec.Struct):
+    ticker: str = "UNKNOWN"
+
+    def __post_init__(self) -> None:
+        # מנרמל פעם אחת בזמן הפענוח — ה-handler מקבל ticker מוכן
+        self.ticker = self.ticker.strip().upper()
+
+async def parse_req(request: Request) -> StockRequest:
+    try:
+        return msgspec.json.decode(await request.body(), type=StockRequest)
+    except msgspec.ValidationError as e:
+        raise HTTPException(
+            status_code=422,
+            detail=[{"loc": ["body"], "msg": str(e), "type": "value_error"}],
+        )
+    except msgspec.DecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+
 # ==============================================================
 # 🤖 Core Analysis Logic (Demo / Mock)
 # ==============================================================
 # בגרסה מלאה זה מתחבר ל-Stockron Engine / Yahoo API / AI Agent
 
+_NEWS_SENTIMENTS = ("Positive", "Neutral", "Negative")
+_AI_SIGNALS = ("Strong Buy", "Buy", "Hold", "Sell")
+
 def mock_quant_analysis() -> Dict[str, Any]:
     return {
         "pe_ratio": round(random.uniform(5, 30), 2),
@@ -63,9 +92,9 @@ def mock_quality_analysis() -> Dict[str, Any]:
 
 def mock_catalyst_analysis() -> Dict[str, Any]:
     return {
-        "news_sentiment": random.choice(["Positive", "Neutral", "Negative"]),
+        "news_sentiment": random.choice(_NEWS_SENTIMENTS),
         "sector_momentum": round(random.uniform(-5, 10), 1),
-        "ai_signal": random.choice(["Strong Buy", "Buy", "Hold", "Sell"])
+        "ai_signal": random.choice(_AI_SIGNALS)
     }
 
 # ==============================================================
@@ -73,9 +102,8 @@ def mock_catalyst_analysis() -> Dict[str, Any]:
 # ==============================================================
 
 @app.post("/analyze")
-async def analyze_stock(request: Request):
-    data = await request.json()
-    ticker = data.get("ticker", "Unknown").upper()
+async def analyze_stock(req: StockRequest = Depends(parse_req)) -> Dict[str, Any]:
+    ticker = req.ticker
 
     # סימולציה של עיבוד — בגרסה הבאה יחובר למנוע ה-AI האמיתי
     quant = mock_quant_analysis()
@@ -120,4 +148,11 @@ async def analyze_stock(request: Request):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=int(os.environ.get("PORT", 10000)))
+    uvicorn.run(
+        "ai_analyzer_server:app",
+        host="0.0.0.0",
+        port=int(os.environ.get("PORT", 10000)),
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", 2)),
+    )
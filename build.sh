@@ -4,9 +4,12 @@ set -o errexit
 pip install --no-cache-dir \
     fastapi \
     uvicorn \
+    uvloop \
+    httptools \
     yfinance \
     pandas \
     numpy \
     pydantic \
+    msgspec \
     requests \
     python-dateutil